@@ -29,12 +29,41 @@ HEADERS = {
     "Referer": "https://www.google.com/"
 }
 
+EXTRACT_JS = """
+(nodes, sels) => nodes.map((node) => {
+    const q = (sel) => (sel ? node.querySelector(sel) : null);
+    const text = (sel) => {
+        const el = q(sel);
+        return el ? el.innerText : null;
+    };
+    const attr = (sel, name) => {
+        const el = q(sel);
+        return el ? el.getAttribute(name) : null;
+    };
+    // Check these attributes in order of priority for lazy-loaded sites
+    const img = q(sels.image);
+    const image = img
+        ? img.getAttribute("src") ||
+          img.getAttribute("data-src") ||
+          img.getAttribute("data-bgsrc") ||
+          img.getAttribute("srcset")
+        : null;
+    return {
+        title: text(sels.title),
+        link: attr(sels.link, "href"),
+        image: image,
+        author: text(sels.author),
+        date: text(sels.date),
+        snippet: text(sels.snippet),
+    };
+})
+"""
+
 
 async def scrape_js_site():
     async with async_playwright() as p:
         browser = await p.chromium.launch(
             headless=True,
-            slow_mo=50,
             args=[
                 "--disable-blink-features=AutomationControlled",
                 "--no-sandbox",
@@ -55,49 +84,27 @@ async def scrape_js_site():
 
         # Navigation with safety
         await page.goto(base_url, wait_until="domcontentloaded", timeout=90000)
-        await page.wait_for_timeout(3000)
+        try:
+            await page.wait_for_selector(selectors["container"], state="attached", timeout=10000)
+        except Exception:
+            print("(Timeout) Container selector not found, continuing with fallback...")
 
-        # Try finding article containers
-        articles = await page.query_selector_all(selectors["container"])
+        # Try finding article containers; all fields are read in one browser-side pass
+        articles = await page.eval_on_selector_all(selectors["container"], EXTRACT_JS, selectors)
 
         if len(articles) <= 1:
             print("(Fallback) Trying sibling container pattern...")
-            articles = await page.query_selector_all("div.entry-image + div.entry-details")
+            articles = await page.eval_on_selector_all(
+                "div.entry-image + div.entry-details", EXTRACT_JS, selectors
+            )
 
         for index, article in enumerate(articles, start=1):
-
-            async def safe_text(selector):
-                if not selector:
-                    return None
-                el = await article.query_selector(selector)
-                return (await el.inner_text()) if el else None
-
-            async def safe_attr(selector, attr):
-                if not selector:
-                    return None
-                el = await article.query_selector(selector)
-                return await el.get_attribute(attr) if el else None
-            # Updated Image Extraction Logic
-            image_el = await article.query_selector(selectors.get("image"))
-            image = None
-            if image_el:
-                # Check these attributes in order of priority for lazy-loaded sites
-                image = (
-                    await image_el.get_attribute("src") or 
-                    await image_el.get_attribute("data-src") or 
-                    await image_el.get_attribute("data-bgsrc") or
-                    await image_el.get_attribute("srcset")
-                )
-            # image = (
-            #     await safe_attr(selectors.get("image"), "data-bgsrc")
-            #     or await safe_attr(selectors.get("image"), "src")
-            # )
-
-            title = await safe_text(selectors.get("title"))
-            link = await safe_attr(selectors.get("link"), "href")
-            author = await safe_text(selectors.get("author"))
-            date = await safe_text(selectors.get("date"))
-            snippet = await safe_text(selectors.get("snippet"))
+            title = article["title"]
+            link = article["link"]
+            image = article["image"]
+            author = article["author"]
+            date = article["date"]
+            snippet = article["snippet"]
 
             full_link = urljoin(base_url, link) if link else None
 
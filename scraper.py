@@ -6,25 +6,34 @@ scraper.py
 - Appends new articles to a single Google Sheet (dedup by link)
 """
 
+import asyncio
+import functools
 import os
-import json
+import random
 import re
 import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from urllib.parse import urljoin
 import dateutil.parser
+import orjson
+import requests
+from bs4 import BeautifulSoup
 from dateutil.relativedelta import relativedelta
-from playwright.sync_api import sync_playwright
+from playwright.async_api import async_playwright
 import gspread
 from gspread.exceptions import APIError
-from oauth2client.service_account import ServiceAccountCredentials
+from google.oauth2.service_account import Credentials
 
 # ---------------- CONFIG ----------------
 SHEET_NAME = "jharkhand_news"
 CONFIG_DIR = "config"
 SPREADSHEET_ID = "1y_DXPvLZVC843ED6mXmCq2NsL5pF83JJSi_6C0W3L98"
 CUT_OFF_HOURS = 25
+MAX_CONCURRENCY = 4  # sites scraped in parallel
+PAGE_TIMEOUT_MS = 55000  # per-site budget for page load + container waits
+MAX_SAVE_ATTEMPTS = 6
+RETRY_STATUS_CODES = {429, 500, 503}
 # ----------------------------------------
 
 IST = timezone(timedelta(hours=5, minutes=30))
@@ -37,48 +46,71 @@ GSHEET_CREDS_JSON = os.environ.get("GSHEET_CREDS")
 if not GSHEET_CREDS_JSON:
     raise RuntimeError("Environment variable GSHEET_CREDS is not set!")
 
-creds_dict = json.loads(GSHEET_CREDS_JSON)
+creds_dict = orjson.loads(GSHEET_CREDS_JSON)
 scope = [
     "https://spreadsheets.google.com/feeds",
     "https://www.googleapis.com/auth/drive",
 ]
-creds = ServiceAccountCredentials.from_json_keyfile_dict(creds_dict, scope)
+creds = Credentials.from_service_account_info(creds_dict, scopes=scope)
 gc = gspread.authorize(creds)
-sheet = gc.open_by_key(SPREADSHEET_ID).sheet1
+spreadsheet = gc.open_by_key(SPREADSHEET_ID)
+# Same worksheet as spreadsheet.sheet1, but fetch only the sheet properties
+# instead of the full spreadsheet metadata.
+_sheet_meta = spreadsheet.fetch_sheet_metadata(params={"fields": "sheets.properties"})
+sheet = gspread.Worksheet(spreadsheet, _sheet_meta["sheets"][0]["properties"], spreadsheet.id, spreadsheet.client)
 
 # ---------------- EXISTING LINKS ----------------
+def normalize_link(url):
+    """Canonical form used for dedup, both in the sheet and for scraped links."""
+    return url.strip().rstrip("/")
+
+_SHEET_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}")
+
+@functools.lru_cache(maxsize=4096)
+def parse_sheet_date(date_str):
+    """Parse a 'date_text' cell. Rows written by this scraper are ISO-like
+    ("%Y-%m-%d %H:%M:%S"), so try fromisoformat before falling back to dateutil.
+    Cached because many rows share the same timestamp."""
+    try:
+        return datetime.fromisoformat(date_str)
+    except ValueError:
+        return dateutil.parser.parse(date_str)
+
 def load_existing_links():
     """Fetch only last 2 days of links from Google Sheet to speed up duplicate checking."""
     try:
-        rows = sheet.get_all_values()
+        # Only the date_text (C) and link (D) columns are needed; skip the header row.
+        rows = sheet.get("C2:D")
     except APIError as e:
         print(f"⚠️ Failed to load sheet data: {e}")
         return set()
 
-    links = set()
     cutoff_date = now_ist() - timedelta(days=2)
+    # Naive dates in the sheet are IST wall time, so compare them against a
+    # naive IST cutoff instead of attaching tzinfo to every row.
+    cutoff_naive = cutoff_date.replace(tzinfo=None)
+
+    # DateParser.format output sorts lexicographically, so well-formed cells need no parsing.
+    cutoff_str = cutoff_naive.strftime("%Y-%m-%d %H:%M:%S")
+
+    def is_recent(date_str):
+        # Keep link only if published in last 2 days or date missing (safe fallback)
+        if not date_str:
+            return True
+        if _SHEET_DATE_RE.fullmatch(date_str):
+            return date_str >= cutoff_str
+        try:
+            dt = parse_sheet_date(date_str)
+        except Exception:
+            return True
+        return dt >= (cutoff_naive if dt.tzinfo is None else cutoff_date)
 
-    for row in rows[1:]:
-        # Assuming the date is stored in column index 2 (3rd column) → 'date_text'
-        # and link in index 3 (4th column)
-        if len(row) > 3 and row[3].strip():
-            date_str = row[2].strip() if len(row) > 2 else ""
-            link = row[3].strip().rstrip("/")
-
-            # Parse date to filter recent rows
-            try:
-                if date_str:
-                    dt = dateutil.parser.parse(date_str)
-                    if dt.tzinfo is None:
-                        dt = dt.replace(tzinfo=IST)
-                else:
-                    dt = None
-            except Exception:
-                dt = None
-
-            # Keep link only if published in last 2 days or date missing (safe fallback)
-            if not dt or dt >= cutoff_date:
-                links.add(link)
+    # row[0] is column C → 'date_text', row[1] is column D → link
+    links = {
+        normalize_link(row[1])
+        for row in rows
+        if len(row) > 1 and row[1].strip() and is_recent(row[0].strip())
+    }
 
     print(f"✅ Loaded {len(links)} recent links (last 2 days) from sheet")
     return links
@@ -86,41 +118,102 @@ def load_existing_links():
 existing_links = load_existing_links()
 print(f"✅ Loaded {len(existing_links)} existing links from sheet")
 
+# ---------------- SHEET WRITES ----------------
+def append_rows_with_backoff(rows):
+    """Append rows in one request, retrying transient API errors with exponential
+    backoff and jitter. Returns True once the rows are written."""
+    for attempt in range(MAX_SAVE_ATTEMPTS):
+        try:
+            sheet.append_rows(rows, value_input_option="RAW")
+            return True
+        except APIError as e:
+            print(f"❌ Error saving rows: {e}")
+            if e.response.status_code not in RETRY_STATUS_CODES or attempt == MAX_SAVE_ATTEMPTS - 1:
+                return False
+            delay = min(60, 2 ** attempt) + random.random()
+            retry_after = e.response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                delay = max(delay, int(retry_after))
+            print(f"⚠️ Sheets API {e.response.status_code}. Retrying in {delay:.1f}s...")
+            time.sleep(delay)
+    return False
+
 # ---------------- DATE PARSER ----------------
+_PUNCT_RE = re.compile(r"[,|•]")
+_AGO_RE = re.compile(r"ago", re.IGNORECASE)
+_TODAY_RE = re.compile(r"today", re.IGNORECASE)
+_YESTERDAY_RE = re.compile(r"yesterday", re.IGNORECASE)
+_REL_PATTERNS = [
+    (re.compile(patt, re.IGNORECASE), unit)
+    for patt, unit in [
+        (r"(\d+)\s+hour", "hours"),
+        (r"(\d+)\s+hr", "hours"),
+        (r"(\d+)\s+minute", "minutes"),
+        (r"(\d+)\s+min", "minutes"),
+        (r"(\d+)\s+day", "days"),
+        (r"(\d+)\s+week", "weeks"),
+        (r"(\d+)\s+month", "months"),
+        (r"(\d+)\s+year", "years"),
+    ]
+]
+# Punctuation is already replaced by spaces, and a space in a format matches any run of whitespace.
+_KNOWN_DATE_FORMATS = (
+    "%d %B %Y",
+    "%d %b %Y",
+    "%B %d %Y",
+    "%b %d %Y",
+)
+# Fills fields missing from the text (e.g. the year); built once instead of dateutil calling now() per parse.
+_DATEUTIL_DEFAULT = now_ist().replace(tzinfo=None, hour=12, minute=0, second=0, microsecond=0)
+
 class DateParser:
     @staticmethod
     def parse_date(date_text):
         if not date_text:
             return None
-        text = str(date_text).strip()
-        text = re.sub(r"[,|•]", " ", text)
+        # Sites repeat the same date strings across articles. Keying on the current
+        # hour keeps "x hours ago" / "today" results fresh without re-parsing each time.
+        hour = now_ist().replace(minute=0, second=0, microsecond=0)
+        return DateParser._parse_date_cached(str(date_text).strip(), hour)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _parse_date_cached(text, hour):
+        text = _PUNCT_RE.sub(" ", text)
         now = now_ist()
-        if "ago" in text.lower():
+        if _AGO_RE.search(text):
             return DateParser.parse_relative(text, now)
-        if "today" in text.lower():
+        if _TODAY_RE.search(text):
             return now.replace(hour=12, minute=0, second=0, microsecond=0)
-        if "yesterday" in text.lower():
+        if _YESTERDAY_RE.search(text):
             return (now - timedelta(days=1)).replace(hour=12, minute=0, second=0, microsecond=0)
+        parsed = DateParser.parse_known(text)
+        if parsed is None:
+            try:
+                parsed = dateutil.parser.parse(text, fuzzy=True, default=_DATEUTIL_DEFAULT)
+            except Exception:
+                return None
+        return parsed.replace(tzinfo=IST, hour=12, minute=0, second=0, microsecond=0)
+
+    @staticmethod
+    def parse_known(text):
+        """Cheap exact-format attempts before the fuzzy dateutil fallback."""
+        text = text.strip()
         try:
-            parsed = dateutil.parser.parse(text, fuzzy=True)
-            return parsed.replace(tzinfo=IST, hour=12, minute=0, second=0, microsecond=0)
-        except Exception:
-            return None
+            return datetime.fromisoformat(text)
+        except ValueError:
+            pass
+        for fmt in _KNOWN_DATE_FORMATS:
+            try:
+                return datetime.strptime(text, fmt)
+            except ValueError:
+                continue
+        return None
 
     @staticmethod
     def parse_relative(text, now):
-        patterns = [
-            (r"(\d+)\s+hour", "hours"),
-            (r"(\d+)\s+hr", "hours"),
-            (r"(\d+)\s+minute", "minutes"),
-            (r"(\d+)\s+min", "minutes"),
-            (r"(\d+)\s+day", "days"),
-            (r"(\d+)\s+week", "weeks"),
-            (r"(\d+)\s+month", "months"),
-            (r"(\d+)\s+year", "years"),
-        ]
-        for patt, unit in patterns:
-            m = re.search(patt, text, re.IGNORECASE)
+        for patt, unit in _REL_PATTERNS:
+            m = patt.search(text)
             if m:
                 n = int(m.group(1))
                 delta = {
@@ -139,6 +232,90 @@ class DateParser:
         return dt.astimezone(IST).strftime("%Y-%m-%d %H:%M:%S") if dt else ""
 
 # ---------------- SCRAPER ----------------
+# Runs in the page: returns the raw fields of the first `limit` containers.
+EXTRACT_ARTICLES_JS = """
+({ selectors, limit }) => {
+    const nodes = Array.from(document.querySelectorAll(selectors.container));
+    const items = nodes.slice(0, limit).map((node) => {
+        const q = (sel) => (sel ? node.querySelector(sel) : null);
+        const text = (sel) => {
+            const el = q(sel);
+            return el ? el.textContent : null;
+        };
+        const linkEl = q(selectors.link) || q(selectors.title);
+        const imageEl = q(selectors.image);
+        return {
+            link: linkEl ? linkEl.getAttribute("href") || linkEl.getAttribute("data-href") : null,
+            title: text(selectors.title),
+            date: text(selectors.date),
+            snippet: text(selectors.snippet),
+            author: text(selectors.author),
+            image: imageEl
+                ? imageEl.getAttribute("src") ||
+                  imageEl.getAttribute("data-src") ||
+                  imageEl.getAttribute("data-lazy-src") ||
+                  imageEl.getAttribute("srcset")
+                : null,
+        };
+    });
+    return { total: nodes.length, items };
+}
+"""
+
+# Several sites block the default python-requests agent; look like a browser (as jstest.py does).
+STATIC_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/122.0.0.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-IN,en;q=0.9,hi-IN;q=0.8,hi;q=0.7",
+}
+
+STATIC_FIELDS = ("link", "title", "date", "snippet", "author", "image")
+
+def extract_static_href(node, link_sel, title_sel):
+    link_el = (node.select_one(link_sel) if link_sel else None) or (
+        node.select_one(title_sel) if title_sel else None
+    )
+    return (link_el.get("href") or link_el.get("data-href")) if link_el else None
+
+def extract_static_fields(node, href, title_sel, date_sel, snippet_sel, author_sel, image_sel):
+    """BeautifulSoup counterpart of EXTRACT_ARTICLES_JS for one container.
+    The caller has already read the href (extract_static_href) and resolves the
+    remaining selectors once per config (see STATIC_FIELDS)."""
+    def q(sel):
+        return node.select_one(sel) if sel else None
+
+    def text(sel):
+        el = q(sel)
+        return el.get_text() if el else None
+
+    image_el = q(image_sel)
+    return {
+        "link": href,
+        "title": text(title_sel),
+        "date": text(date_sel),
+        "snippet": text(snippet_sel),
+        "author": text(author_sel),
+        "image": (
+            image_el.get("src") or
+            image_el.get("data-src") or
+            image_el.get("data-lazy-src") or
+            image_el.get("srcset")
+        ) if image_el else None,
+    }
+
+# Only DOM text/attributes are read, so these are never needed.
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet"}
+
+async def block_heavy_resources(route):
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
 class SheetNewsScraper:
     def __init__(self, config_dir=CONFIG_DIR):
         self.config_dir = Path(config_dir)
@@ -150,91 +327,136 @@ class SheetNewsScraper:
         return [p for p in self.config_dir.glob("*.json")]
 
     def load_config(self, path):
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return orjson.loads(Path(path).read_bytes())
 
     def run(self):
-        configs = self.get_configs()
+        asyncio.run(self.run_async())
+
+    async def run_async(self):
+        configs = [(p, self.load_config(p)) for p in self.get_configs()]
+        semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=True, args=["--no-sandbox", "--disable-dev-shm-usage"])
+            try:
+                results = await asyncio.gather(
+                    *[self.scrape_site_limited(semaphore, browser, config) for _, config in configs],
+                    return_exceptions=True,
+                )
+            finally:
+                await browser.close()
+
+        # Sheet writes stay sequential so dedup against existing_links sees earlier sites.
         total_found = 0
         total_saved = 0
-        for cfg_path in configs:
-            config = self.load_config(cfg_path)
+        for (cfg_path, config), articles in zip(configs, results):
             site_name = config.get("site", cfg_path.stem)
-            print(f"\n🚀 Starting: {site_name}")
             try:
-                articles = self.scrape_site(config)
+                if isinstance(articles, Exception):
+                    raise articles
                 total_found += len(articles)
-                saved = self.save_articles(articles)
+                saved = self.save_articles(articles, site_name)
                 total_saved += saved
                 print(f"📊 {site_name}: found={len(articles)} | saved={saved}")
             except Exception as e:
                 print(f"❌ Error processing {site_name}: {e}")
         print(f"\n🎉 Done. Total found={total_found}, saved={total_saved} new rows.")
 
-    def scrape_site(self, config):
+    async def scrape_site_limited(self, semaphore, browser, config):
+        async with semaphore:
+            print(f"\n🚀 Starting: {config.get('site', config['base_url'])}")
+            return await self.scrape_site(config, browser)
+
+    async def scrape_site(self, config, browser):
         base_url = config["base_url"]
         selectors = config["article"]
         limit = config.get("limit", 20)
+        site_name = config.get("site", "Unknown")
         articles = []
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True, args=["--no-sandbox", "--disable-dev-shm-usage"])
-            page = browser.new_page()
-            try:
-                page.goto(base_url, wait_until="domcontentloaded", timeout=45000)
-                page.wait_for_selector(selectors["container"], timeout=10000)
-                elements = page.query_selector_all(selectors["container"])
-                print(f"🔍 Found {len(elements)} elements")
-                for el in elements[:limit]:
-                    data = self.extract_article(el, base_url, config)
-                    if self.is_valid(data):
-                        if data.get("published_date") and data["published_date"] < self.cutoff_time:
-                            continue
-                        articles.append(data)
-            except Exception as e:
-                print(f"⚠️ Scrape error for {base_url}: {e}")
-            finally:
-                browser.close()
+        try:
+            # Server-rendered sites can opt out of the browser with "js_required": false.
+            if config.get("js_required", True):
+                found = await self.fetch_rendered(browser, base_url, selectors, limit)
+            else:
+                found = await asyncio.to_thread(self.fetch_static, base_url, selectors, limit)
+            print(f"🔍 {site_name}: found {found['total']} elements")
+            for raw in found["items"]:
+                # Dedup on the link alone before paying for date parsing and the rest.
+                link = self.resolve_link(raw.get("link"), base_url)
+                if link in existing_links:
+                    print(f"⏩ {site_name}: skipping duplicate {link}")
+                    continue
+                data = self.extract_article(raw, link, base_url, site_name)
+                if self.is_valid(data):
+                    if data.get("published_date") and data["published_date"] < self.cutoff_time:
+                        continue
+                    articles.append((link, self.build_row(data)))
+        except Exception as e:
+            print(f"⚠️ Scrape error for {base_url}: {e}")
         return articles
 
-    def extract_article(self, el, base_url, config):
-        selectors = config["article"]
-        site_name = config.get("site", "Unknown")
-
-        def q(sel):
-            return el.query_selector(sel) if sel else None
-
-        link_el = q(selectors.get("link", "")) or q(selectors.get("title", ""))
-        title_el = q(selectors.get("title", ""))
-        date_el = q(selectors.get("date", ""))
-        snippet_el = q(selectors.get("snippet", ""))
-        image_el = q(selectors.get("image", ""))
-        author_el = q(selectors.get("author", ""))
-
-        link = None
-        if link_el:
-            href = link_el.get_attribute("href") or link_el.get_attribute("data-href")
-            if href:
-                link = urljoin(base_url, href.strip()).rstrip("/")
-
-        title = title_el.text_content().strip() if title_el else None
-        snippet = snippet_el.text_content().strip() if snippet_el else None
-        author = author_el.text_content().strip() if author_el else None
+    async def fetch_rendered(self, browser, base_url, selectors, limit):
+        context = await browser.new_context()
+        await context.route("**/*", block_heavy_resources)
+        page = await context.new_page()
+        try:
+            # One deadline covers navigation and both readiness waits, so a stale
+            # selector still fails within the old goto + selector budget.
+            deadline = time.monotonic() + PAGE_TIMEOUT_MS / 1000
+
+            def remaining_ms():
+                # Playwright treats 0 as "no timeout", so never pass less than 1 ms.
+                return max(1, int((deadline - time.monotonic()) * 1000))
+
+            # Return as soon as navigation commits; the waits below gate readiness.
+            await page.goto(base_url, wait_until="commit", timeout=remaining_ms())
+            await page.wait_for_selector(selectors["container"], timeout=remaining_ms())
+            # The first container can appear while the document is still parsing;
+            # wait until there are enough of them or parsing has finished.
+            await page.wait_for_function(
+                "([sel, n]) => document.readyState !== 'loading' || document.querySelectorAll(sel).length >= n",
+                arg=[selectors["container"], limit],
+                timeout=remaining_ms(),
+            )
+            # One round-trip: every field of every container is read inside the browser.
+            return await page.evaluate(EXTRACT_ARTICLES_JS, {"selectors": selectors, "limit": limit})
+        finally:
+            await context.close()
+
+    def fetch_static(self, base_url, selectors, limit):
+        response = requests.get(base_url, headers=STATIC_HEADERS, timeout=15)
+        response.raise_for_status()
+        # Raw bytes let BeautifulSoup honour <meta charset>; requests falls back to
+        # ISO-8859-1 when the header has no charset, which garbles Hindi text.
+        soup = BeautifulSoup(response.content, "html.parser")
+        nodes = soup.select(selectors["container"])
+        fields = [selectors.get(key) for key in STATIC_FIELDS]
+        link_sel, title_sel = fields[0], fields[1]
+        items = []
+        for node in nodes[:limit]:
+            # scrape_site drops known links, so only the href is read for those.
+            href = extract_static_href(node, link_sel, title_sel)
+            if self.resolve_link(href, base_url) in existing_links:
+                items.append({"link": href})
+            else:
+                items.append(extract_static_fields(node, href, *fields[1:]))
+        return {"total": len(nodes), "items": items}
+
+    def resolve_link(self, href, base_url):
+        return normalize_link(urljoin(base_url, href.strip())) if href else None
+
+    def extract_article(self, raw, link, base_url, site_name):
+        title = raw["title"].strip() if raw.get("title") is not None else None
+        snippet = raw["snippet"].strip() if raw.get("snippet") is not None else None
+        author = raw["author"].strip() if raw.get("author") is not None else None
 
         image = None
-        if image_el:
-            src = (
-                image_el.get_attribute("src") or 
-                image_el.get_attribute("data-src") or
-                image_el.get_attribute("data-lazy-src") or
-                image_el.get_attribute("srcset")
-            )
-            if src and not src.startswith("data:"):
-                image = urljoin(base_url, src.strip())
-        image_el = q(selectors.get("image", ""))
+        src = raw.get("image")
+        if src and not src.startswith("data:"):
+            image = urljoin(base_url, src.strip())
 
         published_date = None
-        if date_el:
-            published_date = DateParser.parse_date(date_el.text_content())
+        if raw.get("date") is not None:
+            published_date = DateParser.parse_date(raw["date"])
 
         return {
             "source": site_name,
@@ -253,40 +475,39 @@ class SheetNewsScraper:
             return False
         if len(art["title"]) < 6:
             return False
-        link_clean = art["link"].strip().rstrip("/")
-        if link_clean in existing_links:
-            print(f"⏩ Skipping duplicate: {link_clean}")
-            return False
         return True
 
-    def save_articles(self, articles):
-        global existing_links
-        saved = 0
-        for a in articles:
-            link_clean = a["link"].strip().rstrip("/")
-            if link_clean in existing_links:
-                continue
-            row = [
-                a.get("source", ""),
-                a.get("title", ""),
-                a.get("date_text", ""),
-                link_clean,
-                a.get("author", ""),
-                a.get("snippet", ""),
-                a.get("image", ""),
-                a.get("scraped_at", ""),
-            ]
-            try:
-                sheet.append_row(row)
-                existing_links.add(link_clean)
-                saved += 1
-                print(f"💾 Saved: {a.get('title')[:70]}")
-            except APIError as e:
-                print(f"❌ Error saving row: {e}")
-                if e.response.status_code == 429:
-                    print("⚠️ Rate limit hit. Retrying in 30s...")
-                    time.sleep(30)
-        return saved
+    def build_row(self, art):
+        return [
+            art.get("source", ""),
+            art.get("title", ""),
+            art.get("date_text", ""),
+            art["link"],
+            art.get("author", ""),
+            art.get("snippet", ""),
+            art.get("image", ""),
+            art.get("scraped_at", ""),
+        ]
+
+    def save_articles(self, articles, site_name):
+        # articles are (link, row) pairs. One pass drops links already in the sheet
+        # (including ones saved for an earlier site this run) and repeats within the batch.
+        pending = {}
+        for link, row in articles:
+            if link not in existing_links:
+                pending.setdefault(link, row)
+
+        if not pending:
+            return 0
+        new_rows = list(pending.values())
+
+        if not append_rows_with_backoff(new_rows):
+            print(f"❌ {site_name}: dropped {len(new_rows)} new rows that could not be saved")
+            return 0
+        existing_links.update(pending)
+        for row in new_rows:
+            print(f"💾 Saved: {row[1][:70]}")
+        return len(new_rows)
 
 if __name__ == "__main__":
     scraper = SheetNewsScraper(CONFIG_DIR)